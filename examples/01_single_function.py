@@ -17,11 +17,11 @@ logger = Logger.get_logger(__name__)
 
 def process_data(data: dict) -> dict:
     """Process data and log operations."""
-    logger.info("Starting data processing", extra={"input_size": len(data)})
+    logger.info("Starting data processing input_size=%s", len(data))
 
     result = {"processed": True, "items": len(data)}
 
-    logger.info("Data processing complete", extra={"output_size": len(result)})
+    logger.info("Data processing complete output_size=%s", len(result))
     return result
 
 
@@ -23,37 +23,34 @@ Logger.configure(
 class DatabaseService:
     """Database operations - verbose logging."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.DatabaseService")
+    logger = Logger.get_logger(f"{__name__}.DatabaseService")
 
     def query(self, sql: str) -> list:
-        self.logger.debug("Executing query", extra={"sql": sql})
-        self.logger.info("Query executed", extra={"rows": 10})
+        self.logger.debug("Executing query sql=%s", sql)
+        self.logger.info("Query executed rows=%s", 10)
         return [{"id": 1}, {"id": 2}]
 
 
 class CacheService:
     """Cache operations - minimal logging."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.CacheService")
+    logger = Logger.get_logger(f"{__name__}.CacheService")
 
     def get(self, key: str) -> str | None:
-        self.logger.debug("Cache lookup", extra={"key": key})
+        self.logger.debug("Cache lookup key=%s", key)
         return "cached_value"
 
     def set(self, key: str, value: str) -> None:
-        self.logger.debug("Cache set", extra={"key": key})
+        self.logger.debug("Cache set key=%s", key)
 
 
 class APIService:
     """API operations - standard logging."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.APIService")
+    logger = Logger.get_logger(f"{__name__}.APIService")
 
     def handle_request(self, endpoint: str) -> dict:
-        self.logger.info("Handling request", extra={"endpoint": endpoint})
+        self.logger.info("Handling request endpoint=%s", endpoint)
         return {"status": "ok"}
 
 
@@ -12,14 +12,19 @@ import logging
 
 from ds_common_logger_py_lib import Logger
 
+VERBOSE_LOGGER_NAME = f"{__name__}.VerboseService"
+STANDARD_LOGGER_NAME = f"{__name__}.StandardService"
+QUIET_LOGGER_NAME = f"{__name__}.QuietService"
+DYNAMIC_LOGGER_NAME = f"{__name__}.DynamicService"
+
 Logger.configure(
     level=logging.DEBUG,
     format_string="[%(asctime)s][%(name)s][{prefix}][%(levelname)s][%(filename)s:%(lineno)d]: %(message)s",
     date_format="%Y-%m-%dT%H:%M:%S",
     logger_levels={
-        f"{__name__}.VerboseService": logging.DEBUG,
-        f"{__name__}.StandardService": logging.INFO,
-        f"{__name__}.QuietService": logging.WARNING,
+        VERBOSE_LOGGER_NAME: logging.DEBUG,
+        STANDARD_LOGGER_NAME: logging.INFO,
+        QUIET_LOGGER_NAME: logging.WARNING,
     },
 )
 
@@ -27,8 +32,7 @@ Logger.configure(
 class VerboseService:
     """Service with verbose DEBUG logging."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.VerboseService")
+    logger = Logger.get_logger(VERBOSE_LOGGER_NAME)
 
     def process(self) -> None:
         self.logger.debug("Debug message - only visible with DEBUG level")
@@ -39,8 +43,7 @@ class VerboseService:
 class StandardService:
     """Service with standard INFO logging."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.StandardService")
+    logger = Logger.get_logger(STANDARD_LOGGER_NAME)
 
     def process(self) -> None:
         self.logger.debug("Debug message - won't be shown")
@@ -51,8 +54,7 @@ class StandardService:
 class QuietService:
     """Service with minimal WARNING logging."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.QuietService")
+    logger = Logger.get_logger(QUIET_LOGGER_NAME)
 
     def process(self) -> None:
         self.logger.debug("Debug message - won't be shown")
@@ -63,8 +65,7 @@ class QuietService:
 class DynamicService:
     """Service that changes log level at runtime."""
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.DynamicService")
+    logger = Logger.get_logger(DYNAMIC_LOGGER_NAME)
 
     def process(self) -> None:
         self.logger.info("Initial info message")
@@ -6,13 +6,15 @@ Description
 -----------
 Example script demonstrating module-level logging and how logger names differ
 between direct execution (``__main__``) and imported modules (e.g. ``helpers``).
+The file and stdout handlers run on a background queue listener (``use_queue=True``)
+so logging calls do not block on handler I/O.
 """
 
 import logging
 import os
 import sys
 
-from ds_common_logger_py_lib import Logger
+from ds_common_logger_py_lib import BufferedFileHandler, Logger
 
 from helpers import DataValidator, DataTransformer, validate_data_format
 
@@ -21,9 +23,10 @@ log_file_path = os.path.join(os.path.dirname(__file__), "example.log")
 Logger.configure(
     level=logging.DEBUG,
     handlers=[
-        logging.FileHandler(log_file_path),
+        BufferedFileHandler(log_file_path),
         logging.StreamHandler(sys.stdout),
     ],
+    use_queue=True,
 )
 logger = Logger.get_logger(__name__)
 
@@ -31,12 +34,11 @@ logger = Logger.get_logger(__name__)
 class DataProcessor:
     """Main data processor that uses imported modules."""
 
-    def __init__(self) -> None:
-        self.logger = Logger.get_logger(f"{__name__}.DataProcessor")
+    logger = Logger.get_logger(f"{__name__}.DataProcessor")
 
     def process(self, data: dict) -> dict:
         """Process data using imported validators and transformers."""
-        self.logger.info("Starting data processing pipeline", extra={"pipeline": "main"})
+        self.logger.info("Starting data processing pipeline pipeline=%s", "main")
 
         if not validate_data_format(data):
             self.logger.error("Format validation failed, aborting pipeline")
@@ -50,19 +52,17 @@ class DataProcessor:
         transformer = DataTransformer()
         result = transformer.transform(data)
 
-        self.logger.info(
-            "Pipeline completed successfully",
-            extra={"result_keys": list(result.keys())},
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Pipeline completed successfully result_keys=%s", tuple(result))
         return result
 
 
 def main() -> None:
-    logger.info("Application started", extra={"mode": "direct_execution"})
+    logger.info("Application started mode=%s", "direct_execution")
     processor = DataProcessor()
     data = {"name": "alice", "age": 30, "city": "oslo"}
     result = processor.process(data)
-    logger.info("Application finished", extra={"result_count": len(result)})
+    logger.info("Application finished result_count=%s", len(result))
 
 
 if __name__ == "__main__":
@@ -16,7 +16,10 @@ import logging
 import sys
 from pathlib import Path
 
-from ds_common_logger_py_lib import Logger
+from ds_common_logger_py_lib import BufferedFileHandler, Logger
+
+DATABASE_LOGGER_NAME = f"{__name__}.DatabaseService"
+PAYMENT_LOGGER_NAME = f"{__name__}.PaymentService"
 
 Logger.configure(
     prefix="MyApp",
@@ -24,8 +27,8 @@ Logger.configure(
     date_format="%Y-%m-%d %H:%M:%S",
     level=logging.INFO,
     logger_levels={
-        f"{__name__}.DatabaseService": logging.WARNING,
-        f"{__name__}.PaymentService": logging.INFO,
+        DATABASE_LOGGER_NAME: logging.WARNING,
+        PAYMENT_LOGGER_NAME: logging.INFO,
     },
 )
 logger = Logger.get_logger(__name__)
@@ -34,28 +37,23 @@ logger = Logger.get_logger(__name__)
 class DatabaseService:
     """Simulated database service from a package."""
 
-    def __init__(self) -> None:
-        self.logger = Logger.get_logger(f"{__name__}.DatabaseService")
+    logger = Logger.get_logger(DATABASE_LOGGER_NAME)
 
     def connect(self):
-        self.logger.info("Connecting to database", extra={"host": "db.example.com"})
+        self.logger.info("Connecting to database host=%s", "db.example.com")
 
     def query(self, sql: str):
-        self.logger.debug("Executing query", extra={"sql": sql})
+        self.logger.debug("Executing query sql=%s", sql)
         self.logger.info("Query executed successfully")
 
 
 class PaymentService:
     """Simulated payment service from a package."""
 
-    def __init__(self) -> None:
-        self.logger = Logger.get_logger(f"{__name__}.PaymentService")
+    logger = Logger.get_logger(PAYMENT_LOGGER_NAME)
 
     def process_payment(self, amount: float, user_id: str):
-        self.logger.info(
-            "Processing payment",
-            extra={"amount": amount, "user_id": user_id, "currency": "USD"},
-        )
+        self.logger.info("Processing payment amount=%s user_id=%s currency=%s", amount, user_id, "USD")
         self.logger.warning("Payment processed with app prefix included")
 
 
@@ -71,16 +69,16 @@ def main() -> None:
     payment_service.process_payment(99.99, "user_123")
 
     log_file = Path("app.log")
-    file_handler = logging.FileHandler(log_file)
+    file_handler = BufferedFileHandler(log_file)
     file_handler.setLevel(logging.INFO)
 
     Logger.add_handler(file_handler)
 
     logger.info("This message goes to both stdout and app.log file")
-    logger.info("Check app.log to see file logging in action", extra={"file": str(log_file)})
+    logger.info("Check app.log to see file logging in action file=%s", log_file)
 
-    Logger.set_prefix("MyApp-v2")
     Logger.configure(
+        prefix="MyApp-v2",
         format_string="[{prefix}] %(levelname)s: %(message)s",
         force=True,
     )
@@ -116,8 +114,7 @@ def main() -> None:
     logger.warning("Warning messages also go to stderr")
     logger.error("Error messages go to stderr")
 
-    if log_file.exists():
-        log_file.unlink()
+    log_file.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
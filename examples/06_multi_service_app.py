@@ -10,9 +10,12 @@ the logger without knowing about the app configuration.
 
 This demonstrates the key use case: applications need control over logging
 format and handlers, while packages can use the logger transparently.
+Handlers run on a background queue listener (``use_queue=True``), so order
+processing only enqueues records instead of waiting on handler I/O.
 """
 
 import logging
+from functools import cache
 from typing import Any
 
 from ds_common_logger_py_lib import Logger
@@ -22,6 +25,7 @@ Logger.configure(
     format_string="[%(asctime)s][{prefix}][%(name)s][%(levelname)s]: %(message)s",
     date_format="%Y-%m-%d %H:%M:%S",
     level=logging.INFO,
+    use_queue=True,
 )
 # ============================================================================
 # Service 1: Inventory Service (from a package)
@@ -36,30 +40,27 @@ class InventoryService:
     but automatically gets the [OrderService] prefix and format.
     """
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.InventoryService")
+    __slots__ = ()
+
+    logger = Logger.get_logger(f"{__name__}.InventoryService")
 
     def check_stock(self, product_id: str, quantity: int) -> bool:
-        self.logger.info(
-            "Checking stock availability",
-            extra={"product_id": product_id, "requested_quantity": quantity},
-        )
         in_stock = quantity <= 100
         self.logger.info(
-            "Stock check complete",
-            extra={"product_id": product_id, "in_stock": in_stock},
+            "Stock checked product_id=%s requested_quantity=%s in_stock=%s",
+            product_id,
+            quantity,
+            in_stock,
         )
         return in_stock
 
     def reserve_items(self, product_id: str, quantity: int) -> str:
         reservation_id = f"res_{product_id}_{quantity}"
         self.logger.info(
-            "Items reserved",
-            extra={
-                "product_id": product_id,
-                "quantity": quantity,
-                "reservation_id": reservation_id,
-            },
+            "Items reserved product_id=%s quantity=%s reservation_id=%s",
+            product_id,
+            quantity,
+            reservation_id,
         )
         return reservation_id
 
@@ -77,19 +78,18 @@ class PaymentService:
     gets the application's logging configuration.
     """
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.PaymentService")
+    __slots__ = ()
 
-    def process_payment(self, order_id: str, amount: float, currency: str = "USD") -> dict[str, Any]:
-        self.logger.info(
-            "Processing payment",
-            extra={"order_id": order_id, "amount": amount, "currency": currency},
-        )
+    logger = Logger.get_logger(f"{__name__}.PaymentService")
 
+    def process_payment(self, order_id: str, amount: float, currency: str = "USD") -> dict[str, Any]:
         payment_id = f"pay_{order_id}"
         self.logger.info(
-            "Payment processed successfully",
-            extra={"order_id": order_id, "payment_id": payment_id},
+            "Payment processed order_id=%s amount=%s currency=%s payment_id=%s",
+            order_id,
+            amount,
+            currency,
+            payment_id,
         )
 
         return {"payment_id": payment_id, "status": "success"}
@@ -107,28 +107,18 @@ class ShippingService:
     Automatically gets the application's configuration.
     """
 
-    def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.ShippingService")
+    __slots__ = ()
 
-    def calculate_shipping(self, order_id: str, address: dict[str, Any]) -> float:
-        self.logger.info(
-            "Calculating shipping cost",
-            extra={"order_id": order_id, "address": address},
-        )
+    logger = Logger.get_logger(f"{__name__}.ShippingService")
 
+    def calculate_shipping(self, order_id: str, address: dict[str, Any]) -> float:
         cost = 5.99
-        self.logger.info(
-            "Shipping cost calculated",
-            extra={"order_id": order_id, "cost": cost},
-        )
+        self.logger.info("Shipping cost calculated order_id=%s address=%s cost=%s", order_id, address, cost)
         return cost
 
     def create_shipment(self, order_id: str) -> str:
         tracking_number = f"TRACK_{order_id}"
-        self.logger.info(
-            "Shipment created",
-            extra={"order_id": order_id, "tracking_number": tracking_number},
-        )
+        self.logger.info("Shipment created order_id=%s tracking_number=%s", order_id, tracking_number)
         return tracking_number
 
 
@@ -144,8 +134,11 @@ class OrderProcessor:
     This is part of the main application and gets the same configuration.
     """
 
+    __slots__ = ("inventory", "payment", "shipping")
+
+    logger = Logger.get_logger(f"{__name__}.OrderProcessor")
+
     def __init__(self):
-        self.logger = Logger.get_logger(f"{__name__}.OrderProcessor")
         self.inventory = InventoryService()
         self.payment = PaymentService()
         self.shipping = ShippingService()
@@ -160,20 +153,15 @@ class OrderProcessor:
         order_id = f"order_{user_id}_{product_id}"
 
         self.logger.info(
-            "Starting order processing",
-            extra={
-                "order_id": order_id,
-                "user_id": user_id,
-                "product_id": product_id,
-                "quantity": quantity,
-            },
+            "Starting order processing order_id=%s user_id=%s product_id=%s quantity=%s",
+            order_id,
+            user_id,
+            product_id,
+            quantity,
         )
 
         if not self.inventory.check_stock(product_id, quantity):
-            self.logger.error(
-                "Order failed: insufficient stock",
-                extra={"order_id": order_id, "product_id": product_id},
-            )
+            self.logger.error("Order failed: insufficient stock order_id=%s product_id=%s", order_id, product_id)
             return {"status": "failed", "reason": "out_of_stock"}
 
         reservation_id = self.inventory.reserve_items(product_id, quantity)
@@ -182,14 +170,12 @@ class OrderProcessor:
         tracking_number = self.shipping.create_shipment(order_id)
 
         self.logger.info(
-            "Order processed successfully",
-            extra={
-                "order_id": order_id,
-                "reservation_id": reservation_id,
-                "payment_id": payment_result["payment_id"],
-                "tracking_number": tracking_number,
-                "shipping_cost": shipping_cost,
-            },
+            "Order processed successfully order_id=%s reservation_id=%s payment_id=%s tracking_number=%s shipping_cost=%s",
+            order_id,
+            reservation_id,
+            payment_result["payment_id"],
+            tracking_number,
+            shipping_cost,
         )
 
         return {
@@ -199,8 +185,14 @@ class OrderProcessor:
         }
 
 
+@cache
+def get_order_processor() -> OrderProcessor:
+    """Return the shared OrderProcessor, creating it on first use."""
+    return OrderProcessor()
+
+
 def main() -> None:
-    processor = OrderProcessor()
+    processor = get_order_processor()
 
     _ = processor.process_order(
         user_id="user_123",
@@ -8,6 +8,8 @@ Helper module used by example scripts to demonstrate logging in imported code,
 including module-level loggers and class-based logging.
 """
 
+import logging
+
 from ds_common_logger_py_lib import Logger
 
 
@@ -16,13 +18,13 @@ logger = Logger.get_logger(__name__)
 
 def validate_data_format(data: dict) -> bool:
     """Validate data format using function-level logger."""
-    logger.info("Validating data format", extra={"data_type": type(data).__name__})
+    logger.info("Validating data format data_type=%s", type(data).__name__)
 
     if not data:
         logger.warning("Empty dictionary provided")
         return False
 
-    logger.info("Format validation successful", extra={"key_count": len(data)})
+    logger.info("Format validation successful key_count=%s", len(data))
     return True
 
 
@@ -31,13 +33,13 @@ class DataValidator:
 
     def validate(self, data: dict) -> bool:
         """Validate data structure."""
-        logger.info("Starting validation", extra={"data_keys": list(data.keys())})
+        logger.info("Starting validation data_keys=%s", tuple(data))
 
         if not data:
             logger.warning("Empty data dictionary")
             return False
 
-        logger.info("Validation successful", extra={"item_count": len(data)})
+        logger.info("Validation successful item_count=%s", len(data))
         return True
 
 
@@ -46,9 +48,10 @@ class DataTransformer:
 
     def transform(self, data: dict) -> dict:
         """Transform data structure."""
-        logger.info("Starting transformation", extra={"input_keys": list(data.keys())})
+        logger.info("Starting transformation input_keys=%s", tuple(data))
 
         transformed = {f"transformed_{k}": str(v).upper() for k, v in data.items()}
 
-        logger.debug("Transformation complete", extra={"output_keys": list(transformed.keys())})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transformation complete output_keys=%s", tuple(transformed))
         return transformed
@@ -4,8 +4,8 @@
 
 Description
 -----------
-Package entrypoint that exposes the public API (``Logger``, ``LoggerFilter``)
-and the installed package version (``__version__``).
+Package entrypoint that exposes the public API (``Logger``, ``LoggerFilter``,
+``BufferedFileHandler``) and the installed package version (``__version__``).
 
 Example
 -------
@@ -26,7 +26,8 @@ from importlib.metadata import version
 
 from .core import Logger
 from .formatter import LoggerFilter
+from .handlers import BufferedFileHandler
 
 __version__ = version("ds_common_logger_py_lib")
 
-__all__ = ["Logger", "LoggerFilter", "__version__"]
+__all__ = ["BufferedFileHandler", "Logger", "LoggerFilter", "__version__"]
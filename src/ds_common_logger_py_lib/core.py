@@ -25,13 +25,88 @@ Example
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import ClassVar
 
 from .formatter import ExtraFieldsFormatter, LoggerFilter
 
 
+class _QueueListener(QueueListener):
+    """
+    QueueListener that can drop a handler after dispatching the records queued so far.
+
+    The running state and the dispatching thread are tracked here through the
+    public start(), stop() and handle() methods rather than read from
+    QueueListener internals.
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord], *handlers: logging.Handler) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: The queue the QueueHandler puts records on.
+            handlers: The handlers records are dispatched to.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._state_lock = threading.Lock()
+        self._running = False
+        self._dispatch_thread: int | None = None
+
+    def start(self) -> None:
+        """Start the background thread, if it is not running."""
+        with self._state_lock:
+            if not self._running:
+                super().start()
+                self._running = True
+
+    def stop(self) -> None:
+        """Stop the background thread, if running, after it has processed queued records."""
+        with self._state_lock:
+            if self._running:
+                super().stop()
+                self._running = False
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """
+        Dispatch a record to the handlers, remembering the dispatching thread.
+
+        Args:
+            record: The record to dispatch.
+        """
+        self._dispatch_thread = threading.get_ident()
+        super().handle(record)
+
+    def remove_handler(self, handler: logging.Handler) -> None:
+        """
+        Drop a handler once the records queued before this call have reached it.
+
+        The listener is stopped, which dispatches everything queued up to its stop
+        marker, and restarted without the handler. When called from the
+        dispatching thread itself, the handler is dropped without draining.
+
+        Args:
+            handler: The handler to drop.
+        """
+        if threading.get_ident() == self._dispatch_thread:
+            self.handlers = tuple(h for h in self.handlers if h is not handler)
+            return
+
+        with self._state_lock:
+            running = self._running
+            if running:
+                super().stop()
+            self.handlers = tuple(h for h in self.handlers if h is not handler)
+            if running:
+                super().start()
+
+
 class Logger:
     """
     Logger class for the application with static methods only.
@@ -58,6 +133,14 @@ class Logger:
     DEFAULT_FORMAT_WITH_PREFIX = "[%(asctime)s][{prefix}][%(name)s][%(levelname)s][%(filename)s:%(lineno)d]: %(message)s"
     DEFAULT_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+    # logging module flags controlling optional LogRecord fields, and the format fields that need them
+    _RECORD_FIELD_FLAGS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "logThreads": ("%(thread)", "%(threadName)"),
+        "logProcesses": ("%(process)",),
+        "logMultiprocessing": ("%(processName)",),
+        "logAsyncioTasks": ("%(taskName)",),
+    }
+
     _configured: bool = False
     _prefix: str = ""
     _format_string: str | None = DEFAULT_FORMAT_WITH_PREFIX
@@ -68,6 +151,14 @@ class Logger:
     _managed_loggers: ClassVar[set[str]] = set()
     _logger_levels: ClassVar[dict[str, int]] = {}
     _filter: LoggerFilter = LoggerFilter(managed_loggers=_managed_loggers)
+    _queue_handler: QueueHandler | None = None
+    _queue_listener: _QueueListener | None = None
+    _queue_atexit_registered: bool = False
+    _trim_record_fields: bool = False
+    _saved_record_field_flags: ClassVar[dict[str, bool]] = {}
+    _formatter: ExtraFieldsFormatter | None = None
+    _formatter_key: tuple[str, str, str] | None = None
+    _configure_lock: ClassVar[threading.RLock] = threading.RLock()
 
     @staticmethod
     def configure(
@@ -80,13 +171,16 @@ class Logger:
         allowed_prefixes: set[str] | None = None,
         logger_levels: dict[str, int] | None = None,
         force: bool = False,
+        use_queue: bool = False,
+        trim_record_fields: bool = False,
     ) -> None:
         """
         Configure application-level logging settings.
 
         This should be called once at application startup, before any packages
         start using the logger. The configuration will be applied to all loggers
-        created via Logger.get_logger().
+        created via Logger.get_logger(). Repeated calls without force are cheap
+        no-ops, and concurrent first calls are serialized so only one applies.
 
         Args:
             prefix: Prefix to inject into log messages (via {prefix} in format).
@@ -108,6 +202,17 @@ class Logger:
                            those names (e.g., setting "myapp" sets the parent logger
                            for "myapp.*"). Pass an empty dict to clear existing rules.
             force: If True, force reconfiguration even if already configured.
+            use_queue: If True, the handlers are run by a background QueueListener and
+                       only a QueueHandler is attached to the root logger, so logging
+                       calls enqueue records instead of blocking on handler I/O.
+                       The listener is stopped (and drained) at interpreter exit.
+                       The queue is unbounded, so records are never dropped or
+                       blocked on while the listener catches up.
+            trim_record_fields: If True, stop collecting thread, process and asyncio task
+                                details on LogRecords when format_string does not use them,
+                                saving several lookups per record. These are process-wide
+                                logging settings, so only enable this when no other handler
+                                relies on those fields.
 
         Example:
             >>> from ds_common_logger_py_lib import Logger
@@ -127,55 +232,55 @@ class Logger:
         if Logger._configured and not force:
             return
 
-        was_configured = Logger._configured
-        Logger._configured = True
+        with Logger._configure_lock:
+            if Logger._configured and not force:
+                return
 
-        if not was_configured or prefix:
-            Logger._prefix = prefix
+            if not Logger._configured or prefix:
+                Logger._prefix = prefix
 
-        Logger._format_string = format_string
-        Logger._date_format = date_format
+            Logger._format_string = format_string
+            Logger._date_format = date_format
 
-        Logger._level = level
-        Logger._filter = LoggerFilter(
-            allowed_prefixes=allowed_prefixes,
-            managed_loggers=Logger._managed_loggers,
-        )
+            Logger._level = level
+            Logger._filter = LoggerFilter(
+                allowed_prefixes=allowed_prefixes,
+                managed_loggers=Logger._managed_loggers,
+            )
 
-        previous_logger_levels: dict[str, int] | None = None
-        if logger_levels is not None:
-            previous_logger_levels = dict(Logger._logger_levels)
-            Logger._logger_levels = dict(logger_levels)
+            previous_logger_levels: dict[str, int] | None = None
+            if logger_levels is not None:
+                previous_logger_levels = dict(Logger._logger_levels)
+                Logger._logger_levels = dict(logger_levels)
 
-        if default_handler is not None:
-            Logger._default_handler = default_handler
-        elif handlers is not None:
-            Logger._handlers = list(handlers)
-            Logger._default_handler = None
-        else:
-            Logger._default_handler = logging.StreamHandler(sys.stdout)
-            Logger._default_handler.setLevel(level)
-            Logger._handlers = []
+            Logger._set_sink_handlers(handlers, default_handler, level)
+            Logger._setup_filter()
+            Logger._stop_queue_listener()
 
-        Logger._setup_filter()
-
-        root_logger = logging.getLogger()
-        root_logger.setLevel(level)
+            root_logger = logging.getLogger()
+            root_logger.setLevel(level)
 
-        if force:
-            root_logger.handlers.clear()
+            if force:
+                root_logger.handlers.clear()
 
-        formatter = Logger._create_formatter()
-        if Logger._default_handler:
-            Logger._default_handler.setFormatter(formatter)
-            root_logger.addHandler(Logger._default_handler)
-        else:
-            for handler in Logger._handlers:
+            formatter = Logger._create_formatter()
+            sink_handlers = [Logger._default_handler] if Logger._default_handler else list(Logger._handlers)
+            for handler in sink_handlers:
                 handler.setFormatter(formatter)
-                root_logger.addHandler(handler)
 
-        Logger._update_existing_loggers()
-        Logger._apply_logger_levels(previous_logger_levels)
+            if use_queue:
+                Logger._start_queue_listener(sink_handlers)
+            else:
+                for handler in sink_handlers:
+                    root_logger.addHandler(handler)
+
+            if trim_record_fields or Logger._trim_record_fields:
+                Logger._trim_record_fields = trim_record_fields
+                Logger._apply_record_field_flags()
+
+            Logger._update_existing_loggers()
+            Logger._apply_logger_levels(previous_logger_levels)
+            Logger._configured = True
 
     @staticmethod
     def get_logger(
@@ -243,6 +348,38 @@ class Logger:
         Logger._prefix = prefix
         Logger._update_existing_loggers()
 
+    @staticmethod
+    def set_level(level: int) -> None:
+        """
+        Update the default logging level at runtime.
+
+        Only the root logger and default handler levels change; handler
+        formatters and filters are left as they are, so this is cheap enough
+        to call whenever the verbosity needs to change.
+
+        If Logger.configure() hasn't been called yet, this will automatically
+        configure it with default settings and the provided level.
+
+        Args:
+            level: New default logging level.
+
+        Example:
+            >>> from ds_common_logger_py_lib import Logger
+            >>> import logging
+            >>> Logger.configure()
+            >>> Logger.set_level(logging.DEBUG)
+            >>> logger = Logger.get_logger(__name__)
+            >>> logger.debug("Debug messages are now visible")
+        """
+        if not Logger._configured:
+            Logger.configure(level=level)
+            return
+
+        Logger._level = level
+        logging.getLogger().setLevel(level)
+        if Logger._default_handler:
+            Logger._default_handler.setLevel(level)
+
     @staticmethod
     def set_log_format(
         format_string: str | None = None,
@@ -272,10 +409,12 @@ class Logger:
         else:
             Logger._date_format = Logger.DEFAULT_DATE_FORMAT
 
-        # Update root logger handlers only (child loggers propagate to root)
-        root_logger = logging.getLogger()
+        if Logger._trim_record_fields:
+            Logger._apply_record_field_flags()
+
+        # Update root (or queue listener) handlers only (child loggers propagate to root)
         formatter = Logger._create_formatter()
-        for handler in root_logger.handlers:
+        for handler in Logger._attached_handlers():
             if isinstance(handler.formatter, ExtraFieldsFormatter):
                 handler.setFormatter(formatter)
 
@@ -286,6 +425,8 @@ class Logger:
 
         When Logger.configure() is called, handlers are on the root logger only.
         Package loggers propagate to root, so they will use this handler automatically.
+        If Logger.configure() was called with use_queue=True, the handler is added
+        to the background queue listener instead.
 
         Args:
             handler: Handler to add.
@@ -305,14 +446,18 @@ class Logger:
         handler.addFilter(Logger._filter)
         handler.setFormatter(Logger._create_formatter())
         Logger._handlers.append(handler)
-        root_logger = logging.getLogger()
-        root_logger.addHandler(handler)
+        Logger._attach_handler(handler)
 
     @staticmethod
     def remove_handler(handler: logging.Handler) -> None:
         """
         Remove a handler from the root logger.
 
+        If Logger.configure() was called with use_queue=True, this blocks until the
+        records queued before the call have been dispatched, so the handler still
+        receives them. Logging calls and add_handler() do not wait; calls that stop
+        or drain the listener, such as configure(force=True), wait behind it.
+
         Args:
             handler: Handler to remove.
 
@@ -327,12 +472,10 @@ class Logger:
         if not Logger._configured:
             return
 
-        if handler in Logger._handlers:
+        with contextlib.suppress(ValueError):
             Logger._handlers.remove(handler)
 
-        root_logger = logging.getLogger()
-        if handler in root_logger.handlers:
-            root_logger.removeHandler(handler)
+        Logger._detach_handler(handler)
 
     @staticmethod
     def set_default_handler(handler: logging.Handler) -> None:
@@ -364,8 +507,52 @@ class Logger:
         formatter = Logger._create_formatter()
         handler.setFormatter(formatter)
 
-        root_logger = logging.getLogger()
-        root_logger.addHandler(handler)
+        Logger._attach_handler(handler)
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Reset Logger to its unconfigured state.
+
+        Stops the queue listener, detaches the handlers Logger attached to the
+        root logger, clears logger-level rules and restores the default settings,
+        so the next configure() call behaves like the first one. Handlers are
+        detached but not closed. Mainly useful in tests.
+
+        Example:
+            >>> from ds_common_logger_py_lib import Logger
+            >>> Logger.configure(prefix="MyApp")
+            >>> Logger.reset()
+            >>> Logger.is_configured()
+            False
+        """
+        with Logger._configure_lock:
+            Logger._stop_queue_listener()
+
+            root_logger = logging.getLogger()
+            for handler in [*Logger._handlers, Logger._default_handler]:
+                if handler is not None:
+                    root_logger.removeHandler(handler)
+
+            previous_logger_levels = Logger._logger_levels
+            Logger._logger_levels = {}
+            Logger._apply_logger_levels(previous_logger_levels)
+
+            if Logger._trim_record_fields:
+                Logger._trim_record_fields = False
+                Logger._apply_record_field_flags()
+
+            Logger._configured = False
+            Logger._prefix = ""
+            Logger._format_string = Logger.DEFAULT_FORMAT_WITH_PREFIX
+            Logger._date_format = Logger.DEFAULT_DATE_FORMAT
+            Logger._level = logging.INFO
+            Logger._handlers = []
+            Logger._default_handler = None
+            Logger._managed_loggers.clear()
+            Logger._filter = LoggerFilter(managed_loggers=Logger._managed_loggers)
+            Logger._formatter = None
+            Logger._formatter_key = None
 
     @staticmethod
     def is_configured() -> bool:
@@ -448,6 +635,9 @@ class Logger:
     def _create_formatter() -> ExtraFieldsFormatter:
         """Create a formatter with current configuration.
 
+        The formatter is cached and shared by all managed handlers; it is only
+        rebuilt when the format string, date format or prefix changes.
+
         Returns:
             ExtraFieldsFormatter instance with current configuration.
         """
@@ -456,13 +646,43 @@ class Logger:
             format_string = Logger.DEFAULT_FORMAT
         date_format = Logger._date_format or Logger.DEFAULT_DATE_FORMAT
 
+        key = (format_string, date_format, Logger._prefix)
+        if Logger._formatter is not None and Logger._formatter_key == key:
+            return Logger._formatter
+
         template_vars: dict[str, str] = {"prefix": Logger._prefix}
 
-        return ExtraFieldsFormatter(
+        Logger._formatter = ExtraFieldsFormatter(
             fmt=format_string,
             datefmt=date_format,
             template_vars=template_vars,
         )
+        Logger._formatter_key = key
+        return Logger._formatter
+
+    @staticmethod
+    def _set_sink_handlers(
+        handlers: list[logging.Handler] | None,
+        default_handler: logging.Handler | None,
+        level: int,
+    ) -> None:
+        """
+        Store the handlers configure() attaches, falling back to a stdout StreamHandler.
+
+        Args:
+            handlers: Handlers passed to configure(), or None.
+            default_handler: Default handler passed to configure(), or None.
+            level: Level for the fallback StreamHandler.
+        """
+        if default_handler is not None:
+            Logger._default_handler = default_handler
+        elif handlers is not None:
+            Logger._handlers = list(handlers)
+            Logger._default_handler = None
+        else:
+            Logger._default_handler = logging.StreamHandler(sys.stdout)
+            Logger._default_handler.setLevel(level)
+            Logger._handlers = []
 
     @staticmethod
     def _setup_filter() -> None:
@@ -476,13 +696,12 @@ class Logger:
     def _update_existing_loggers() -> None:
         """Update root logger handlers managed by Logger with current configuration."""
         formatter = Logger._create_formatter()
-        root_logger = logging.getLogger()
 
         managed_handlers: set[logging.Handler] = set(Logger._handlers)
         if Logger._default_handler:
             managed_handlers.add(Logger._default_handler)
 
-        for handler in root_logger.handlers:
+        for handler in Logger._attached_handlers():
             if handler not in managed_handlers:
                 continue
 
@@ -493,6 +712,106 @@ class Logger:
             if handler is Logger._default_handler:
                 handler.setLevel(Logger._level)
 
+    @staticmethod
+    def _attached_handlers() -> list[logging.Handler]:
+        """Get the handlers records are dispatched to.
+
+        Returns:
+            The root logger handlers followed by the queue listener handlers, if any.
+        """
+        handlers = list(logging.getLogger().handlers)
+        if Logger._queue_listener is not None:
+            handlers.extend(Logger._queue_listener.handlers)
+        return handlers
+
+    @staticmethod
+    def _attach_handler(handler: logging.Handler) -> None:
+        """Attach a handler to the queue listener if queueing, else to the root logger.
+
+        Args:
+            handler: The handler to attach.
+        """
+        if Logger._queue_listener is not None:
+            Logger._queue_listener.handlers = (*Logger._queue_listener.handlers, handler)
+        else:
+            logging.getLogger().addHandler(handler)
+
+    @staticmethod
+    def _detach_handler(handler: logging.Handler) -> None:
+        """Detach a handler from the queue listener and the root logger.
+
+        Records queued before the call still reach the handler. The listener is
+        drained without holding the configure lock.
+
+        Args:
+            handler: The handler to detach.
+        """
+        listener = Logger._queue_listener
+        if listener is not None:
+            listener.remove_handler(handler)
+
+        root_logger = logging.getLogger()
+        if handler in root_logger.handlers:
+            root_logger.removeHandler(handler)
+
+    @staticmethod
+    def _start_queue_listener(handlers: list[logging.Handler]) -> None:
+        """Run handlers on a background QueueListener fed by a root QueueHandler.
+
+        Args:
+            handlers: The handlers the listener dispatches records to.
+        """
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        Logger._queue_handler = QueueHandler(log_queue)
+        Logger._queue_handler.addFilter(Logger._filter)
+        Logger._queue_listener = _QueueListener(log_queue, *handlers)
+        Logger._queue_listener.start()
+        logging.getLogger().addHandler(Logger._queue_handler)
+
+        if not Logger._queue_atexit_registered:
+            atexit.register(Logger._stop_queue_listener)
+            Logger._queue_atexit_registered = True
+
+    @staticmethod
+    def _stop_queue_listener() -> None:
+        """Stop the queue listener, if running, after it has processed queued records.
+
+        The QueueHandler is detached first so no records are queued behind the
+        stop marker, and the listener is only forgotten once it has stopped.
+        """
+        listener = Logger._queue_listener
+        if listener is None:
+            return
+
+        if Logger._queue_handler is not None:
+            logging.getLogger().removeHandler(Logger._queue_handler)
+
+        listener.stop()
+        Logger._queue_listener = None
+        Logger._queue_handler = None
+
+    @staticmethod
+    def _apply_record_field_flags() -> None:
+        """Disable the optional LogRecord fields the active format does not use.
+
+        Flags are only ever cleared, never enabled. Their original values are saved
+        when trimming is first enabled and restored when it is turned off.
+        """
+        saved = Logger._saved_record_field_flags
+        if not Logger._trim_record_fields:
+            for flag, value in saved.items():
+                setattr(logging, flag, value)
+            saved.clear()
+            return
+
+        if not saved:
+            saved.update({flag: getattr(logging, flag) for flag in Logger._RECORD_FIELD_FLAGS if hasattr(logging, flag)})
+
+        format_string = Logger._format_string or Logger.DEFAULT_FORMAT
+        for flag, value in saved.items():
+            fields = Logger._RECORD_FIELD_FLAGS[flag]
+            setattr(logging, flag, value and any(field in format_string for field in fields))
+
     @staticmethod
     def _apply_logger_levels(previous_levels: dict[str, int] | None = None) -> None:
         """Apply logger-level rules to logger hierarchy.
@@ -27,6 +27,7 @@ Example
 import json
 import logging
 import re
+import time
 from typing import ClassVar
 
 
@@ -95,14 +96,20 @@ class ExtraFieldsFormatter(logging.Formatter):
     are serialized as JSON and appended to the log message.
 
     The formatter also supports template variables in format strings, such as
-    {prefix}, which are replaced at runtime with values provided by the caller.
+    {prefix}, which are replaced with values provided by the caller. Templates
+    are resolved once when the formatter is created, so each record only goes
+    through the standard %-style formatting. The formatted timestamp is cached
+    per second, so bursts of records within the same second call strftime once.
 
     Args:
         fmt: Format string for the log message. May contain template variables
-             like {prefix} that will be replaced at runtime.
+             like {prefix}, which are replaced once when the formatter is created.
         datefmt: Date format string.
         template_vars: Optional dictionary of template variables to replace in
-                     the format string (e.g., {"prefix": "MyApp"}).
+                     the format string (e.g., {"prefix": "MyApp"}). It is kept as
+                     the template_vars attribute for reference only; changing it
+                     after construction has no effect, so create a new formatter
+                     instead (Logger does this when the prefix changes).
 
     Returns:
         Formatter instance that handles extra fields and template variables.
@@ -122,31 +129,35 @@ class ExtraFieldsFormatter(logging.Formatter):
         [2024-01-15T10:30:45][MyApp][test]: Test message | extra: {"user_id": 123}
     """
 
-    _STANDARD_ATTRS: ClassVar[set[str]] = {
-        "name",
-        "msg",
-        "args",
-        "created",
-        "filename",
-        "funcName",
-        "levelname",
-        "levelno",
-        "lineno",
-        "module",
-        "msecs",
-        "message",
-        "pathname",
-        "process",
-        "processName",
-        "relativeCreated",
-        "thread",
-        "threadName",
-        "exc_info",
-        "exc_text",
-        "stack_info",
-        "taskName",
-        "asctime",
-    }
+    _STANDARD_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "name",
+            "msg",
+            "args",
+            "created",
+            "filename",
+            "funcName",
+            "levelname",
+            "levelno",
+            "lineno",
+            "module",
+            "msecs",
+            "message",
+            "pathname",
+            "process",
+            "processName",
+            "relativeCreated",
+            "thread",
+            "threadName",
+            "exc_info",
+            "exc_text",
+            "stack_info",
+            "taskName",
+            "asctime",
+        }
+    )
+
+    _EXTRA_ENCODER: ClassVar[json.JSONEncoder] = json.JSONEncoder(default=str)
 
     def __init__(
         self,
@@ -160,14 +171,19 @@ class ExtraFieldsFormatter(logging.Formatter):
         Args:
             fmt: Format string for the log message.
             datefmt: Date format string.
-            template_vars: Optional dictionary of template variables to replace.
+            template_vars: Optional dictionary of template variables to replace
+                           in fmt. Only read here, at construction.
         """
-        super().__init__(fmt, datefmt)
         self.template_vars = template_vars or {}
+        self._time_cache: tuple[int, str | None, str] = (-1, None, "")
+        if fmt and self.template_vars:
+            fmt = self._resolve_template(fmt)
+        super().__init__(fmt, datefmt)
 
     def _resolve_template(self, fmt: str) -> str:
         """
         Resolve template variables in the format string.
+        Literal "%" in values is escaped so it survives %-style formatting.
         Remove empty bracket pairs: [] and optional space after it
         This handles patterns like "[] " or "[]" at the start/middle/end of format string
 
@@ -182,7 +198,7 @@ class ExtraFieldsFormatter(logging.Formatter):
 
         resolved = fmt
         for key, value in self.template_vars.items():
-            resolved = resolved.replace(f"{{{key}}}", str(value))
+            resolved = resolved.replace(f"{{{key}}}", str(value).replace("%", "%%"))
 
         resolved = re.sub(r"\[\]\s*", "", resolved)
         resolved = re.sub(r"  +", " ", resolved)
@@ -190,6 +206,27 @@ class ExtraFieldsFormatter(logging.Formatter):
             resolved = resolved[1:]
         return resolved
 
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """
+        Format the record creation time, reusing the result within the same second.
+
+        Args:
+            record: The LogRecord instance to format the time of.
+            datefmt: Date format string. Uses the default time format if None.
+
+        Returns:
+            Formatted creation time of the record.
+        """
+        seconds = int(record.created)
+        cached_seconds, cached_datefmt, formatted = self._time_cache
+        if cached_seconds != seconds or cached_datefmt != datefmt:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._time_cache = (seconds, datefmt, formatted)
+
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the log record, including extra fields.
@@ -211,23 +248,17 @@ class ExtraFieldsFormatter(logging.Formatter):
             >>> logger.info("Test", extra={"user_id": 123})
             [2024-01-15T10:30:45][test][INFO][test.py:1]: Test | extra: {"user_id": 123}
         """
-        if self.template_vars and self._fmt:
-            resolved_fmt = self._resolve_template(self._fmt)
-            if resolved_fmt != self._fmt:
-                temp_formatter = logging.Formatter(resolved_fmt, self.datefmt)
-                msg = temp_formatter.format(record)
-            else:
-                msg = super().format(record)
-        else:
-            msg = super().format(record)
-
-        extra_fields = {key: value for key, value in record.__dict__.items() if key not in self._STANDARD_ATTRS}
-
-        if extra_fields:
-            try:
-                extra_str = json.dumps(extra_fields, default=str)
-                msg = f"{msg} | extra: {extra_str}"
-            except (TypeError, ValueError):
-                msg = f"{msg} | extra: {extra_fields}"
+        msg = super().format(record)
+
+        extra_keys = record.__dict__.keys() - self._STANDARD_ATTRS
+        if not extra_keys:
+            return msg
+
+        extra_fields = {key: value for key, value in record.__dict__.items() if key in extra_keys}
+        try:
+            extra_str = self._EXTRA_ENCODER.encode(extra_fields)
+            msg = f"{msg} | extra: {extra_str}"
+        except (TypeError, ValueError):
+            msg = f"{msg} | extra: {extra_fields}"
 
         return msg
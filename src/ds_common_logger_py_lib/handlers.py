@@ -0,0 +1,153 @@
+"""
+**File:** ``handlers.py``
+**Region:** ``ds_common_logger_py_lib``
+
+Description
+-----------
+Defines logging handlers shipped with this package, including a buffered file
+handler that coalesces log writes into fewer, larger ``write()`` calls.
+
+Example
+-------
+    >>> import logging
+    >>> from ds_common_logger_py_lib import BufferedFileHandler, Logger
+    >>>
+    >>> Logger.configure(handlers=[BufferedFileHandler("app.log")])
+    >>> logger = Logger.get_logger(__name__)
+    >>> logger.info("Buffered until the next flush")
+    >>> logger.warning("Warnings flush the buffer immediately")
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import cast
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers records and flushes them in batches.
+
+    The standard FileHandler flushes its stream after every record, which costs
+    one ``write()`` syscall per log line. This handler writes into a block-buffered
+    stream and only flushes when a record at or above ``flush_level`` is emitted,
+    when the buffer is full, or when the handler is closed. Buffered records are
+    also flushed by a background timer at most ``flush_interval`` seconds after
+    the first of them was written, so they reach the file during quiet periods.
+
+    Args:
+        filename: Path of the log file.
+        mode: File open mode.
+        encoding: File encoding.
+        delay: If True, the file is opened on the first emitted record.
+        errors: Encoding error handling scheme.
+        buffer_size: Size of the write buffer in bytes; must be at least 2.
+        flush_interval: Maximum seconds a buffered record waits before it is flushed.
+        flush_level: Records at or above this level are flushed immediately.
+
+    Example:
+        >>> import logging
+        >>> handler = BufferedFileHandler("app.log", buffer_size=65536, flush_interval=1.0)
+        >>> logger = logging.getLogger("test")
+        >>> logger.addHandler(handler)
+        >>> logger.info("Buffered message")
+        >>> handler.close()
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        mode: str = "a",
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        *,
+        buffer_size: int = 65536,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.WARNING,
+    ) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Path of the log file.
+            mode: File open mode.
+            encoding: File encoding.
+            delay: If True, the file is opened on the first emitted record.
+            errors: Encoding error handling scheme.
+            buffer_size: Size of the write buffer in bytes; must be at least 2.
+            flush_interval: Maximum seconds a buffered record waits before it is flushed.
+            flush_level: Records at or above this level are flushed immediately.
+
+        Raises:
+            ValueError: If buffer_size is smaller than 2; open() rejects 0 and
+                treats 1 as line buffering.
+        """
+        if buffer_size < 2:
+            raise ValueError(f"buffer_size must be at least 2 bytes, got {buffer_size}")
+
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._last_flush = time.monotonic()
+        self._flush_timer: threading.Timer | None = None
+        super().__init__(filename, mode, encoding, delay, errors)
+
+    def _open(self) -> io.TextIOWrapper:
+        """
+        Open the log file with a write buffer of ``buffer_size`` bytes.
+
+        Returns:
+            The opened file stream.
+        """
+        stream = Path(self.baseFilename).open(  # noqa: SIM115
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        return cast("io.TextIOWrapper", stream)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write the record to the buffer, flushing only when required.
+
+        As with FileHandler, a handler in mode "w" does not reopen (and truncate)
+        its file for records emitted after close().
+
+        Args:
+            record: The log record to emit.
+        """
+        try:
+            if self.stream is None:
+                if self.mode == "w" and getattr(self, "_closed", False):
+                    return
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the buffered records to the file and cancel the pending timer flush."""
+        self.acquire()
+        try:
+            super().flush()
+            self._last_flush = time.monotonic()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
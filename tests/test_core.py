@@ -9,6 +9,7 @@ creation, handler behavior, format updates, and extra fields support.
 """
 
 import io
+import json
 import logging
 import unittest
 from unittest import TestCase
@@ -28,16 +29,7 @@ class TestLogging(TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        # Reset Logger
-        Logger._configured = False
-        Logger._prefix = ""
-        Logger._format_string = None
-        Logger._date_format = None
-        Logger._level = logging.INFO
-        Logger._handlers = []
-        Logger._default_handler = None
-        Logger._managed_loggers.clear()
-        Logger._logger_levels = {}
+        Logger.reset()
 
         # Reset root logger to clean state
         root_logger = logging.getLogger()
@@ -53,19 +45,29 @@ class TestLogging(TestCase):
             >>> logger = Logger.get_logger(__name__)
             >>> logger.info("Test", extra={"key": "value"})
         """
-        Logger.configure()
+        stream = io.StringIO()
+        Logger.configure(format_string="%(levelname)s: %(message)s", handlers=[logging.StreamHandler(stream)])
         logger = Logger.get_logger(__name__)
 
-        logger.info("Test info message", extra={"test": "info", "number": 42, "boolean": True})
-        logger.warning("Test warning message", extra={"test": "warning", "error_code": 404})
-        logger.error("Test error message", extra={"test": "error", "exception": "TestException"})
-
         complex_data = {
             "user": {"id": 123, "name": "Test User", "active": True},
             "metadata": {"timestamp": "2025-06-29T15:50:00", "version": "1.0.0"},
         }
+        cases = (
+            (logger.info, "Test info message", {"test": "info", "number": 42, "boolean": True}),
+            (logger.warning, "Test warning message", {"test": "warning", "error_code": 404}),
+            (logger.error, "Test error message", {"test": "error", "exception": "TestException"}),
+            (logger.info, "Test with complex data", {"data": complex_data}),
+        )
+
+        for log, message, extra in cases:
+            log(message, extra=extra)
 
-        logger.info("Test with complex data", extra={"data": complex_data})
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), len(cases))
+        for line, (log, message, extra) in zip(lines, cases, strict=True):
+            with self.subTest(message=message):
+                self.assertEqual(line, f"{log.__name__.upper()}: {message} | extra: {json.dumps(extra)}")
 
     def test_logger_initialization(self) -> None:
         """
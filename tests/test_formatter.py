@@ -11,7 +11,9 @@ gracefully.
 
 import io
 import logging
+import time
 import unittest
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -24,10 +26,7 @@ class TestFormatter(TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        Logger._configured = False
-        Logger._filter = LoggerFilter(allowed_prefixes=None)
-        Logger._managed_loggers.clear()
-        Logger._logger_levels = {}
+        Logger.reset()
 
         root_logger = logging.getLogger()
         root_logger.handlers.clear()
@@ -43,10 +42,13 @@ class TestFormatter(TestCase):
         self.logger.addHandler(self.handler)
         self.handler.filters = [f for f in self.handler.filters if not isinstance(f, LoggerFilter)]
         self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
 
     def tearDown(self) -> None:
         """Clean up after tests."""
-        self.logger.handlers.clear()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+        self.stream.close()
         logging.getLogger("test_template").handlers.clear()
 
     def test_formatter_with_extra_fields(self) -> None:
@@ -57,6 +59,11 @@ class TestFormatter(TestCase):
         self.assertIn("extra:", output)
         self.assertIn("user_id", output)
 
+    def test_formatter_keeps_extra_fields_order(self) -> None:
+        """Test extra fields are serialized in the order they were passed."""
+        self.logger.info("Test message", extra={"zeta": 1, "alpha": 2, "mid": 3})
+        self.assertIn('extra: {"zeta": 1, "alpha": 2, "mid": 3}', self.stream.getvalue())
+
     def test_formatter_without_extra_fields(self) -> None:
         """Test formatter works without extra fields."""
         self.logger.info("Simple message")
@@ -78,9 +85,10 @@ class TestFormatter(TestCase):
         def unserializable_func() -> None:
             pass
 
-        # Mock json.dumps to raise an error to test error handling path
-        with patch(
-            "ds_common_logger_py_lib.formatter.json.dumps",
+        # Mock the JSON encoder to raise an error to test error handling path
+        with patch.object(
+            ExtraFieldsFormatter._EXTRA_ENCODER,
+            "encode",
             side_effect=TypeError("Cannot serialize"),
         ):
             self.logger.info("Test", extra={"obj": unserializable_func})
@@ -90,6 +98,11 @@ class TestFormatter(TestCase):
             self.assertIn("extra:", output)
             self.assertIn("obj", output)
 
+    def test_formatter_serializes_non_json_extra_as_string(self) -> None:
+        """Test extra values without a JSON representation are serialized with str()."""
+        self.logger.info("Test", extra={"path": Path("/tmp/app.log"), "count": 2})
+        self.assertIn('extra: {"path": "/tmp/app.log", "count": 2}', self.stream.getvalue())
+
     # ========================================================================
     # Template Variable Resolution Tests
     # ========================================================================
@@ -184,6 +197,56 @@ class TestFormatter(TestCase):
         # Should convert to string
         self.assertIn("[12345]", formatted)
 
+    def test_template_resolved_once_at_init(self) -> None:
+        """Test template variables are resolved into the format when the formatter is created."""
+        formatter = ExtraFieldsFormatter(
+            fmt="[{prefix}] %(message)s",
+            template_vars={"prefix": "MyApp"},
+        )
+
+        self.assertEqual(formatter._fmt, "[MyApp] %(message)s")
+        with patch.object(formatter, "_resolve_template") as resolve_template:
+            record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Test", (), None)
+            self.assertEqual(formatter.format(record), "[MyApp] Test")
+        resolve_template.assert_not_called()
+
+    def test_format_with_percent_in_template_value(self) -> None:
+        """Test format() keeps a literal percent sign from a template variable."""
+        formatter = ExtraFieldsFormatter(
+            fmt="[{prefix}] %(message)s",
+            template_vars={"prefix": "50%"},
+        )
+
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Test", (), None)
+        self.assertEqual(formatter.format(record), "[50%] Test")
+
+    def test_format_time_cached_within_same_second(self) -> None:
+        """Test formatTime() reuses the formatted timestamp for records in the same second."""
+        formatter = ExtraFieldsFormatter(fmt="%(asctime)s %(message)s", datefmt="%Y-%m-%dT%H:%M:%S")
+        first = logging.LogRecord("test", logging.INFO, "test.py", 1, "First", (), None)
+        second = logging.LogRecord("test", logging.INFO, "test.py", 1, "Second", (), None)
+        first.created = 1700000000.1
+        second.created = 1700000000.9
+
+        with patch("ds_common_logger_py_lib.formatter.time.strftime", wraps=time.strftime) as strftime:
+            first_time = formatter.formatTime(first, formatter.datefmt)
+            second_time = formatter.formatTime(second, formatter.datefmt)
+
+        self.assertEqual(first_time, second_time)
+        strftime.assert_called_once()
+
+    def test_format_time_matches_standard_formatter(self) -> None:
+        """Test formatTime() output matches logging.Formatter across seconds and date formats."""
+        formatter = ExtraFieldsFormatter()
+        standard = logging.Formatter()
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Test", (), None)
+
+        for created in (1700000000.25, 1700000000.75, 1700000001.5):
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            for datefmt in (None, "%Y-%m-%dT%H:%M:%S"):
+                self.assertEqual(formatter.formatTime(record, datefmt), standard.formatTime(record, datefmt))
+
     def test_format_without_template_vars_but_with_dict(self) -> None:
         """Test format() with format string without template vars but template_vars dict provided."""
         formatter = ExtraFieldsFormatter(
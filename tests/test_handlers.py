@@ -0,0 +1,157 @@
+"""
+**File:** ``test_handlers.py``
+**Region:** ``ds_common_logger_py_lib``
+
+Description
+-----------
+Unit tests for the handlers shipped with the package, covering buffering and
+flush behavior of ``BufferedFileHandler``.
+"""
+
+import io
+import logging
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from ds_common_logger_py_lib import BufferedFileHandler
+
+
+class TestBufferedFileHandler(TestCase):
+    """Test the BufferedFileHandler functionality."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.tmp_dir.name) / "buffered.log"
+        self.handler = BufferedFileHandler(self.log_path, flush_interval=3600)
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+
+        self.logger = logging.getLogger("test_buffered_handler")
+        self.logger.handlers.clear()
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def tearDown(self) -> None:
+        """Clean up after tests."""
+        self.logger.handlers.clear()
+        self.handler.close()
+        self.tmp_dir.cleanup()
+
+    def test_info_records_are_buffered(self) -> None:
+        """Test records below flush_level stay in the buffer."""
+        self.logger.info("Buffered message")
+        self.assertEqual(self.log_path.read_text(), "")
+
+    def test_flush_level_flushes_buffer(self) -> None:
+        """Test a record at flush_level flushes all buffered records."""
+        self.logger.info("Buffered message")
+        self.logger.warning("Warning message")
+        self.assertEqual(self.log_path.read_text(), "Buffered message\nWarning message\n")
+
+    def test_flush_interval_flushes_buffer(self) -> None:
+        """Test a record emitted after flush_interval flushes the buffer."""
+        self.handler.flush_interval = 0
+        self.logger.info("Interval message")
+        self.assertEqual(self.log_path.read_text(), "Interval message\n")
+
+    def test_flush_timer_flushes_quiet_buffer(self) -> None:
+        """Test buffered records are flushed by the timer when no further record arrives."""
+        self.handler.flush_interval = 0.05
+        self.handler._last_flush = time.monotonic()
+        self.logger.info("Quiet message")
+
+        deadline = time.monotonic() + 5
+        while not self.log_path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.log_path.read_text(), "Quiet message\n")
+        self.assertIsNone(self.handler._flush_timer)
+
+    def test_close_cancels_flush_timer(self) -> None:
+        """Test close() flushes the buffer and cancels the pending timer flush."""
+        self.logger.info("Buffered message")
+        timer = self.handler._flush_timer
+        self.assertIsNotNone(timer)
+
+        self.handler.close()
+        timer.join(timeout=5)
+        self.assertFalse(timer.is_alive())
+        self.assertIsNone(self.handler._flush_timer)
+        self.assertEqual(self.log_path.read_text(), "Buffered message\n")
+
+    def test_buffer_size_too_small_raises(self) -> None:
+        """Test buffer sizes that open() would reject or treat as line buffering raise."""
+        for buffer_size in (0, 1):
+            with self.subTest(buffer_size=buffer_size), self.assertRaises(ValueError):
+                BufferedFileHandler(self.log_path, buffer_size=buffer_size)
+
+    def test_close_flushes_buffer(self) -> None:
+        """Test close() writes buffered records to the file."""
+        self.logger.info("Buffered message")
+        self.handler.close()
+        self.assertEqual(self.log_path.read_text(), "Buffered message\n")
+
+    def test_writes_with_file_encoding(self) -> None:
+        """Test non-ASCII records are written in the handler's encoding."""
+        handler = BufferedFileHandler(self.log_path, mode="w", encoding="utf-8")
+        record = logging.LogRecord("test", logging.ERROR, "test.py", 1, "Blåbær", (), None)
+        handler.emit(record)
+        handler.close()
+        self.assertEqual(self.log_path.read_bytes(), "Blåbær\n".encode())
+
+    def test_bom_encoding_writes_single_bom(self) -> None:
+        """Test encodings with a BOM write it once per file, not once per record."""
+        handler = BufferedFileHandler(self.log_path, mode="w", encoding="utf-16")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for message in ("one", "two"):
+            handler.emit(logging.LogRecord("test", logging.ERROR, "test.py", 1, message, (), None))
+        handler.close()
+        self.assertEqual(self.log_path.read_text(encoding="utf-16"), "one\ntwo\n")
+
+    def test_set_stream_receives_records(self) -> None:
+        """Test records go to a stream installed with setStream()."""
+        stream = io.StringIO()
+        self.handler.setStream(stream)
+        self.logger.warning("Text message")
+        self.assertEqual(stream.getvalue(), "Text message\n")
+
+    def test_delay_opens_file_on_first_record(self) -> None:
+        """Test delay=True defers opening the file until a record is emitted."""
+        delayed_path = Path(self.tmp_dir.name) / "delayed.log"
+        handler = BufferedFileHandler(delayed_path, delay=True)
+        self.assertIsNone(handler.stream)
+        self.assertFalse(delayed_path.exists())
+
+        record = logging.LogRecord("test", logging.ERROR, "test.py", 1, "Delayed", (), None)
+        handler.emit(record)
+        handler.close()
+        self.assertEqual(delayed_path.read_text(), "Delayed\n")
+
+    def test_emit_after_close_does_not_truncate(self) -> None:
+        """Test a record emitted after close() does not reopen a mode "w" file."""
+        handler = BufferedFileHandler(self.log_path, mode="w")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.emit(logging.LogRecord("test", logging.ERROR, "test.py", 1, "Important", (), None))
+        handler.close()
+
+        handler.emit(logging.LogRecord("test", logging.ERROR, "test.py", 1, "Late record", (), None))
+        handler.close()
+        self.assertEqual(self.log_path.read_text(), "Important\n")
+
+    def test_emit_error_is_handled(self) -> None:
+        """Test errors while emitting are routed to handleError()."""
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Test", (), None)
+        with (
+            patch.object(self.handler, "format", side_effect=ValueError("boom")),
+            patch.object(self.handler, "handleError") as handle_error,
+        ):
+            self.handler.emit(record)
+        handle_error.assert_called_once_with(record)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,8 +10,11 @@ Unit tests for the ``Logger`` configuration functionality.
 import io
 import logging
 import sys
+import threading
+import time
 import unittest
 from unittest import TestCase
+from unittest.mock import patch
 
 from ds_common_logger_py_lib import Logger
 from ds_common_logger_py_lib.formatter import ExtraFieldsFormatter, LoggerFilter
@@ -22,15 +25,7 @@ class TestLoggerConfig(TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures - reset Logger state."""
-        Logger._configured = False
-        Logger._prefix = ""
-        Logger._format_string = None
-        Logger._date_format = None
-        Logger._level = logging.INFO
-        Logger._handlers = []
-        Logger._default_handler = None
-        Logger._managed_loggers.clear()
-        Logger._logger_levels = {}
+        Logger.reset()
 
         root_logger = logging.getLogger()
         root_logger.handlers.clear()
@@ -38,6 +33,7 @@ class TestLoggerConfig(TestCase):
 
     def tearDown(self) -> None:
         """Clean up after tests."""
+        Logger._stop_queue_listener()
         for handler in Logger._handlers:
             if hasattr(handler, "close"):
                 handler.close()
@@ -172,6 +168,260 @@ class TestLoggerConfig(TestCase):
         self.assertIn(handler1, root_logger.handlers)
         self.assertIn(handler2, root_logger.handlers)
 
+    def test_set_level_updates_levels_only(self) -> None:
+        """Test set_level() changes root and default handler levels without touching formatters."""
+        Logger.configure(level=logging.INFO)
+        handler = Logger._default_handler
+        self.assertIsNotNone(handler)
+        formatter = handler.formatter
+
+        Logger.set_level(logging.DEBUG)
+
+        self.assertEqual(Logger._level, logging.DEBUG)
+        self.assertEqual(logging.getLogger().level, logging.DEBUG)
+        self.assertEqual(handler.level, logging.DEBUG)
+        self.assertIs(handler.formatter, formatter)
+
+    def test_set_level_configures_when_not_configured(self) -> None:
+        """Test set_level() configures Logger with the given level when not configured."""
+        Logger.set_level(logging.WARNING)
+        self.assertTrue(Logger._configured)
+        self.assertEqual(logging.getLogger().level, logging.WARNING)
+
+    def test_reset_restores_unconfigured_state(self) -> None:
+        """Test reset() detaches managed handlers and restores the defaults."""
+        handler = logging.StreamHandler(io.StringIO())
+        Logger.configure(
+            prefix="Test",
+            handlers=[handler],
+            logger_levels={"myapp": logging.ERROR},
+            use_queue=True,
+            trim_record_fields=True,
+        )
+        Logger.get_logger("myapp.service")
+
+        Logger.reset()
+
+        self.assertFalse(Logger.is_configured())
+        self.assertEqual(Logger.get_prefix(), "")
+        self.assertEqual(Logger._handlers, [])
+        self.assertIsNone(Logger._default_handler)
+        self.assertIsNone(Logger._queue_listener)
+        self.assertEqual(logging.getLogger().handlers, [])
+        self.assertEqual(logging.getLogger("myapp").level, logging.NOTSET)
+        self.assertEqual(Logger.get_managed_loggers(), set())
+        self.assertTrue(logging.logThreads)
+
+        Logger.configure(handlers=[handler])
+        self.assertIn(handler, logging.getLogger().handlers)
+
+    def test_formatter_cached_until_config_changes(self) -> None:
+        """Test the managed formatter is reused until prefix or format changes."""
+        Logger.configure(prefix="Test")
+        formatter = Logger._create_formatter()
+        self.assertIs(Logger._create_formatter(), formatter)
+
+        Logger.set_prefix("Other")
+        new_formatter = Logger._create_formatter()
+        self.assertIsNot(new_formatter, formatter)
+        self.assertEqual(new_formatter.template_vars.get("prefix"), "Other")
+
+    def test_configure_trim_record_fields(self) -> None:
+        """Test trim_record_fields disables only LogRecord fields unused by the format."""
+        self.addCleanup(Logger._apply_record_field_flags)
+        Logger.configure(format_string="[%(threadName)s] %(message)s", trim_record_fields=True)
+        self.assertTrue(logging.logThreads)
+        self.assertFalse(logging.logProcesses)
+        self.assertFalse(logging.logMultiprocessing)
+
+        record = logging.makeLogRecord({"msg": "Test"})
+        self.assertIsNone(record.process)
+        self.assertIsNotNone(record.threadName)
+
+        Logger.set_log_format("%(process)d: %(message)s")
+        self.assertFalse(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+
+        Logger.configure(format_string="%(message)s", force=True)
+        self.assertTrue(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+        self.assertTrue(logging.logMultiprocessing)
+
+    def test_trim_record_fields_preserves_disabled_flags(self) -> None:
+        """Test trimming never enables a flag the application disabled, and restores it."""
+        original = logging.logProcesses
+        self.addCleanup(setattr, logging, "logProcesses", original)
+        logging.logProcesses = False
+
+        Logger.configure(format_string="%(process)d: %(message)s", trim_record_fields=True)
+        self.assertFalse(logging.logProcesses)
+        self.assertFalse(logging.logThreads)
+
+        Logger.reset()
+        self.assertFalse(logging.logProcesses)
+        self.assertTrue(logging.logThreads)
+
+    def test_configure_concurrent_first_calls_apply_once(self) -> None:
+        """Test concurrent configure() calls attach the default handler only once."""
+        barrier = threading.Barrier(8)
+
+        def configure() -> None:
+            barrier.wait()
+            Logger.configure()
+
+        threads = [threading.Thread(target=configure) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(Logger._configured)
+        self.assertEqual(len(logging.getLogger().handlers), 1)
+
+    def test_configure_with_queue(self) -> None:
+        """Test configure(use_queue=True) runs handlers on a queue listener."""
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        Logger.configure(prefix="Test", format_string="%(message)s", handlers=[handler], use_queue=True)
+
+        root_logger = logging.getLogger()
+        self.assertEqual(root_logger.handlers, [Logger._queue_handler])
+        self.assertIsNotNone(Logger._queue_listener)
+        self.assertEqual(Logger._queue_listener.handlers, (handler,))
+
+        Logger.get_logger("test_queue").info("Queued message")
+        Logger._stop_queue_listener()
+
+        self.assertIn("Queued message", stream.getvalue())
+        self.assertIsNone(Logger._queue_listener)
+        self.assertEqual(root_logger.handlers, [])
+
+    def test_queue_handler_management(self) -> None:
+        """Test handler management targets the queue listener when queueing."""
+        Logger.configure(prefix="Test", handlers=[logging.StreamHandler(io.StringIO())], use_queue=True)
+        handler = logging.StreamHandler(io.StringIO())
+
+        Logger.add_handler(handler)
+        self.assertNotIn(handler, logging.getLogger().handlers)
+        self.assertIsNotNone(Logger._queue_listener)
+        self.assertIn(handler, Logger._queue_listener.handlers)
+
+        Logger.set_log_format("%(levelname)s: %(message)s")
+        formatter = handler.formatter
+        self.assertIsInstance(formatter, ExtraFieldsFormatter)
+        if formatter is not None:
+            self.assertEqual(formatter._fmt, "%(levelname)s: %(message)s")
+
+        Logger.remove_handler(handler)
+        self.assertIsNotNone(Logger._queue_listener)
+        self.assertNotIn(handler, Logger._queue_listener.handlers)
+
+    def test_queue_remove_handler_delivers_queued_records(self) -> None:
+        """Test remove_handler() lets queued records reach the handler before detaching it."""
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        Logger.configure(handlers=[handler], format_string="%(message)s", use_queue=True)
+        logger = Logger.get_logger("test_queue_remove")
+
+        for index in range(100):
+            logger.info("Queued %s", index)
+        Logger.remove_handler(handler)
+
+        self.assertEqual(len(stream.getvalue().splitlines()), 100)
+
+    def test_queue_remove_handler_after_listener_died(self) -> None:
+        """Test remove_handler() returns when a failing filter has stopped the listener thread."""
+        handler = logging.StreamHandler(io.StringIO())
+        handler.addFilter(lambda record: 1 / 0)
+        Logger.configure(handlers=[handler], use_queue=True)
+        listener = Logger._queue_listener
+        self.assertIsNotNone(listener)
+
+        with patch.object(threading, "excepthook"):
+            Logger.get_logger("test_queue_dead").info("Kills the listener")
+            listener._thread.join(timeout=5)
+
+        worker = threading.Thread(target=Logger.remove_handler, args=(handler,), daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+        self.assertFalse(worker.is_alive())
+        self.assertNotIn(handler, listener.handlers)
+
+    def test_queue_remove_handler_from_listener_thread(self) -> None:
+        """Test a handler can remove itself while the listener dispatches to it."""
+
+        class SelfRemovingHandler(logging.StreamHandler):
+            def emit(self, record: logging.LogRecord) -> None:
+                super().emit(record)
+                Logger.remove_handler(self)
+
+        stream = io.StringIO()
+        handler = SelfRemovingHandler(stream)
+        Logger.configure(handlers=[handler], format_string="%(message)s", use_queue=True)
+        logger = Logger.get_logger("test_queue_self_remove")
+
+        logger.info("First")
+        logger.info("Second")
+        Logger._stop_queue_listener()
+
+        self.assertEqual(stream.getvalue(), "First\n")
+
+    def test_queue_remove_handler_does_not_hold_configure_lock(self) -> None:
+        """Test draining the queue in remove_handler() does not block configuration."""
+        release = threading.Event()
+
+        class BlockingHandler(logging.StreamHandler):
+            def emit(self, record: logging.LogRecord) -> None:
+                release.wait(5)
+                super().emit(record)
+
+        stream = io.StringIO()
+        handler = BlockingHandler(stream)
+        Logger.configure(handlers=[handler], format_string="%(message)s", use_queue=True)
+        Logger.get_logger("test_queue_lock").info("Blocked")
+
+        worker = threading.Thread(target=Logger.remove_handler, args=(handler,), daemon=True)
+        worker.start()
+        acquired = Logger._configure_lock.acquire(timeout=1)
+        if acquired:
+            Logger._configure_lock.release()
+        release.set()
+        worker.join(timeout=5)
+
+        self.assertTrue(acquired)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(stream.getvalue(), "Blocked\n")
+
+    def test_stop_queue_listener_delivers_backlog(self) -> None:
+        """Test stopping the listener behind a slow handler delivers every queued record."""
+
+        class SlowHandler(logging.StreamHandler):
+            def emit(self, record: logging.LogRecord) -> None:
+                time.sleep(0.01)
+                super().emit(record)
+
+        stream = io.StringIO()
+        Logger.configure(handlers=[SlowHandler(stream)], format_string="%(message)s", use_queue=True)
+        logger = Logger.get_logger("test_queue_backlog")
+
+        for index in range(10):
+            logger.info("Queued %s", index)
+        Logger._stop_queue_listener()
+
+        self.assertEqual(len(stream.getvalue().splitlines()), 10)
+        self.assertIsNone(Logger._queue_listener)
+        self.assertEqual(logging.getLogger().handlers, [])
+
+    def test_configure_force_replaces_queue_listener(self) -> None:
+        """Test reconfiguring without use_queue stops the previous listener."""
+        Logger.configure(prefix="Test", use_queue=True)
+        self.assertIsNotNone(Logger._queue_listener)
+
+        Logger.configure(prefix="Test", force=True)
+        self.assertIsNone(Logger._queue_listener)
+        self.assertIsNone(Logger._queue_handler)
+        self.assertIn(Logger._default_handler, logging.getLogger().handlers)
+
 
 if __name__ == "__main__":
     unittest.main()